@@ -12,10 +12,10 @@ __version__ = "2.0.2"
 __author__ = "github.com/alemigo"
 
 # Imports
-from builtins import open as python_open
 import os
 import io
-import math
+import sys
+import bisect
 import shutil
 
 # from splitfile import *
@@ -25,24 +25,42 @@ __all__ = ["SplitFile", "open"]
 class SplitFile(object):
     """Interface to read and write a stream across multiple volumes"""
 
-    file = None  # Python file object
-    file_name = None  # Filename of first volume
-    file_index = 0  # Volume index
-    file_pos = 0  # Track file position in current volume
-    total_pos = 0  # Track file position in total file (all volumes)
-    volumes = []  # List of max volume sizes and cumulative total sizes by index
-    mode = None  # IO mode: rb, wb, rb+, wb+
-    volume_size = 0  # Maximum size of new volumes
-    append_to_partial = True  # Append new data to partially used volumes
-    buffer = None  # Buffer for uncompressed, unencrypted data
-    last_nl = 0  # Position in buffer up to which no \n was found
-    first_io = True  # First read or write of stream (first volume)
-    last_io = None  # Type of last IO performed (read vs write)
-    EOF = False  # End of all volumes reached for read operation
-    file_closed = None  # Boolean is file has been closed
-    BLOCKSIZE = 64 * 1024  # Size of read blocks
-
-    def __init__(self, filename, mode, volume_size=0, append_to_partial=True):
+    __slots__ = (
+        "_fd",  # OS file descriptor of the open volume
+        "_volume_dirty",  # Data has been written to the open volume
+        "file_name",  # Filename of first volume
+        "file_index",  # Volume index
+        "file_pos",  # Track file position in current volume
+        "total_pos",  # Track file position in total file (all volumes)
+        "_vol_size",  # Max volume sizes by index
+        "_vol_total",  # Cumulative total sizes by index
+        "_names",  # Cache of volume filenames by index
+        "mode",  # IO mode: rb, wb, rb+, wb+
+        "_can_read",  # Mode allows reading
+        "_can_write",  # Mode allows writing
+        "_is_plus",  # Mode is an update mode (+)
+        "_is_new",  # Mode replaces existing volumes (wb)
+        "_is_append",  # Mode appends to existing volumes (ab)
+        "volume_size",  # Maximum size of new volumes
+        "append_to_partial",  # Append new data to partially used volumes
+        "buffer",  # Read buffer (bytearray)
+        "read_pos",  # Position in buffer of the next unread byte
+        "_read_block",  # Reusable block that volume data is read into
+        "_read_mv",  # Memoryview of _read_block
+        "last_nl",  # Position in buffer up to which no \n was found
+        "first_io",  # First read or write of stream (first volume)
+        "last_io",  # Type of last IO performed (read vs write)
+        "EOF",  # End of all volumes reached for read operation
+        "file_closed",  # Boolean is file has been closed
+        "block_size",  # Size of read blocks for this object
+        "__weakref__",  # Allow weak references, as io file objects do
+    )
+
+    BLOCKSIZE = 256 * 1024  # Default size of read blocks
+
+    def __init__(
+        self, filename, mode, volume_size=0, append_to_partial=True, block_size=None
+    ):
         """Initialize splitfile object"""
 
         # validate parameters
@@ -52,15 +70,29 @@ class SplitFile(object):
         if volume_size < 0:
             raise ValueError("Volume size must be positive or zero")
 
+        if block_size is not None and block_size <= 0:
+            raise ValueError("Block size must be positive")
+
+        self._fd = None
+        self._volume_dirty = False
         self.file_name = filename
         self.mode = mode
+        self._is_plus = "+" in mode
+        self._is_new = "wb" in mode
+        self._is_append = "ab" in mode
+        self._can_read = mode == "rb" or self._is_plus
+        self._can_write = mode != "rb"
         self.file_index = 0
         self.file_pos = 0
         self.total_pos = 0
         self.first_io = True
         self.last_io = None
         self.last_nl = 0
-        self.buffer = b""
+        self.buffer = bytearray()
+        self.read_pos = 0
+        self.block_size = block_size or self.BLOCKSIZE
+        self._read_block = bytearray(self.block_size)
+        self._read_mv = memoryview(self._read_block)
         self.EOF = False
         self.file_closed = False
         self.append_to_partial = append_to_partial
@@ -68,53 +100,50 @@ class SplitFile(object):
 
         # if reading, create list of volumes and volume sizes
         # if writing, delete existing volumes
-        suff = ""
-        i = 1
+        self._names = [self.file_name]
         total_size = 0
-        self.volumes = [{"volume_size": 0, "total_size": 0}]
-        while os.path.exists(self.file_name + suff):
-            if "rb" in mode or "ab" in mode:
-                file_size = os.stat(self.file_name + suff).st_size
+        self._vol_size = [0]
+        self._vol_total = [0]
+        for i, file_size in enumerate(self._scan_volumes(), 1):
+            if not self._is_new:
                 total_size += file_size
-                self.volumes.append(
-                    {"volume_size": file_size, "total_size": total_size}
-                )
-            elif "wb" in mode:
+                self._vol_size.append(file_size)
+                self._vol_total.append(total_size)
+            else:
                 try:
-                    os.remove(self.file_name + suff)
+                    os.remove(self._get_file_name(i))
                 except IOError:
                     raise IOError(
-                        "Unable to overwrite existing volume " + self.file_name + suff
+                        "Unable to overwrite existing volume " + self._get_file_name(i)
                     )
-            i += 1
-            suff = "." + str(i)
 
         # if appending to partially filled volumes, expand volume size of last
         # volume if unused space exists
-        if self.append_to_partial and len(self.volumes) > 1:
-            self.volumes[-1]["volume_size"] = max(
-                self.volumes[-1]["volume_size"], self.volume_size
-            )
+        if self.append_to_partial and len(self._vol_size) > 1:
+            self._vol_size[-1] = max(self._vol_size[-1], self.volume_size)
 
         # open first file
         if not self._next_file():
-            if "rb" in mode:
+            if not self._is_new and not self._is_append:
                 raise FileNotFoundError("File not found")
             else:  # wb or wb+ or ab or ab+
                 raise OSError("Invalid filename")
 
         # seek to end for append mode
-        if "ab" in self.mode:
+        if self._is_append:
             self.seek(0, 2)
 
     def write(self, data):
-        """write method implementation"""
-        if self.mode not in ["wb", "ab"] and "+" not in self.mode:
+        """write method implementation, data can be any bytes-like object"""
+        if not self._can_write:
             raise io.UnsupportedOperation("Cannot write in read mode")
 
         if self.closed:
             raise ValueError("I/O operation on closed file.")
 
+        if self.last_io == "r":  # realign volume position after buffered read
+            self.seek(self.total_pos)
+
         self.last_io = "w"
 
         if self.first_io:  # first write to first volume
@@ -123,67 +152,161 @@ class SplitFile(object):
         return self._write(data)  # write to file
 
     def writelines(self, lines):
-        """writelines implementation"""
+        """writelines implementation, lines are coalesced into blocks so
+           that each write covers many small lines
+        """
+        block = bytearray()
         for line in lines:
-            self.write(line)
+            block += line
+            if len(block) >= self.block_size:
+                self.write(block)
+                block.clear()
+
+        if block:
+            self.write(block)
+
+    def copy_from(self, src, length=None):
+        """copy length bytes, or all remaining data if None, from the current
+           position of SplitFile src to the current position of this file.
+           Data is moved between volume files inside the kernel where the
+           platform supports it.  Returns number of bytes copied.
+        """
+        if not self._can_write:
+            raise io.UnsupportedOperation("Cannot write in read mode")
 
-    def read(self, size=-1, *, line=False):
-        """read method implementation"""
-        if self.mode != "rb" and "+" not in self.mode:
-            raise io.UnsupportedOperation("Cannot read in write mode")
+        if not src._can_read:
+            raise io.UnsupportedOperation("Cannot read source in write mode")
 
-        if self.closed:
+        if self.closed or src.closed:
             raise ValueError("I/O operation on closed file.")
 
-        if self.last_io == "w":  # reset read buffer after write operation
-            self.buffer = b""
-            self.last_nl = 0
+        if src is self:
+            raise ValueError("Cannot copy a file onto itself")
 
-        if self.first_io:  # first read from first volume
-            self.first_io = False
-            self.buffer = b""
-            self.last_nl = 0
+        # align volume positions of both files, discarding buffered reads
+        src.seek(src.total_pos)
+        src.last_io = "r"
+        src.first_io = False
+        if self.last_io == "r":
+            self.seek(self.total_pos)
+        self.last_io = "w"
+        self.first_io = False
+        if self.total_pos > self._vol_total[-1]:
+            self.truncate()
 
-        if self.EOF:
+        remaining = max(src._vol_total[-1] - src.total_pos, 0)
+        if length is not None:
+            remaining = min(remaining, length)
+
+        copied = 0
+        while remaining > 0:
+            # respect volume boundaries on both sides
+            src_size = src._vol_total[src.file_index] - src.total_pos
+            if src_size <= 0:
+                if not src._next_file():
+                    break
+                src.file_pos = 0
+                continue
+
+            copy_size = min(remaining, src_size)
+            if self.volume_size > 0:
+                dst_size = self._vol_size[self.file_index] - self.file_pos
+                if dst_size <= 0:
+                    self._next_file()
+                    continue
+                copy_size = min(copy_size, dst_size)
+
+            n = _copy_range(src._fd, self._fd, copy_size, self.block_size)
+            if n == 0:
+                break
+            src.file_pos += n
+            src.total_pos += n
+            self._advance_write(n)
+            remaining -= n
+            copied += n
+
+        src.EOF = src.total_pos >= src._vol_total[-1]
+        return copied
+
+    def read(self, size=-1, *, line=False):
+        """read method implementation"""
+        if not self._start_read():
             return b""
-        self.last_io = "r"
+
+        # large reads go from volumes straight into the output
+        if size >= self.block_size and not line:
+            # allocate no more than remains in the stream
+            output = bytearray(min(size, max(self._vol_total[-1] - self.total_pos, 0)))
+            with memoryview(output) as mv:
+                n = self._readinto(mv)
+            del output[n:]
+            return bytes(output)
 
         # first check if existing buffer is sufficient
         output = self._read_buffer(size, line)
-        if output:
+        if output is not None:
             return self._return_read(output)
 
-        # add data to buffer
-        while True:
-            data = self._read_file(size)
+        # add data to buffer a block at a time, and try to read from buffer
+        while self._fill_buffer():
+            output = self._read_buffer(size, line)
+            if output is not None:
+                return self._return_read(output)
 
-            if data != b"":
-                self.buffer += data
+        # no more to read, flush buffer
+        output = bytes(memoryview(self.buffer)[self.read_pos :])
+        self._reset_buffer()
+        self.EOF = True
+        return self._return_read(output)
 
-                # try to read from buffer
-                output = self._read_buffer(size, line)
-                if output:
-                    return self._return_read(output)
+    def readinto(self, b):
+        """readinto implementation, reads of at least a block bypass the read
+           buffer and go directly into b
+        """
+        if not self._start_read():
+            return 0
 
-            else:  # no more to read, flush buffer
-                output = self.buffer
-                self.buffer = b""
-                self.last_nl = 0
-                self.EOF = True
-                return self._return_read(output)
+        with memoryview(b) as view, view.cast("B") as mv:
+            return self._readinto(mv)
+
+    def readinto1(self, b):
+        """readinto1 implementation, returns buffered data if available,
+           otherwise performs at most one volume read
+        """
+        if not self._start_read():
+            return 0
+
+        with memoryview(b) as view, view.cast("B") as mv:
+            return self._readinto(mv, single=True)
 
     def readline(self, size=-1):
         """readline implementation"""
         return self.read(size, line=True)
 
     def readlines(self, sizehint=0):
-        """readlines implementation"""
+        """readlines implementation, complete lines are taken from the buffer
+           a block at a time and split by io.BytesIO rather than a readline
+           loop.  If sizehint is positive, stops once sizehint bytes are read.
+        """
         output = []
-        while True:
-            rr = self.readline()
-            if rr == b"":
-                break
-            output.append(rr)
+        if not self._start_read():
+            return output
+
+        read_size = 0
+        while sizehint <= 0 or read_size < sizehint:
+            # only scan data added since the last unsuccessful search
+            end = self.buffer.rfind(b"\n", max(self.last_nl, self.read_pos)) + 1
+            if end:
+                lines = self._return_read(self._read_buffer(end - self.read_pos, False))
+                output += io.BytesIO(lines).readlines()
+                read_size += len(lines)
+            else:
+                self.last_nl = len(self.buffer)
+                if not self._fill_buffer():  # last line has no \n
+                    last_line = self.read()
+                    if last_line:
+                        output.append(last_line)
+                    break
 
         return output
 
@@ -202,52 +325,30 @@ class SplitFile(object):
         if whence == 1:
             offset += self.tell()
         elif whence == 2:
-            offset += self.volumes[-1]["total_size"]
+            offset += self._vol_total[-1]
 
         if offset < 0:
             raise ValueError("Negative seek position")
-        elif offset >= self.volumes[-1]["total_size"]:
-            self.EOF = True
-            self.total_pos = offset
-            return offset
-
-        # guess correct volume by proportion of offset to total size
-        if self.volumes[-1]["total_size"] == 0:
-            i = 1
-        else:
-            i = min(
-                max(
-                    math.ceil(
-                        offset / self.volumes[-1]["total_size"] * len(self.volumes)
-                    ),
-                    1,
-                ),
-                len(self.volumes) - 1,
-            )
 
-        while True:
-            if offset > self.volumes[i]["total_size"]:
-                i += 1
-            elif offset < self.volumes[i - 1]["total_size"]:
-                i -= 1
-            else:
-                break
+        # locate volume by cumulative size, positions at or beyond the end
+        # of the stream are placed at the end of the last volume
+        total_size = self._vol_total[-1]
+        if len(self._vol_total) > 1:
+            volume_offset = min(offset, total_size)
+            i = max(bisect.bisect_left(self._vol_total, volume_offset), 1)
+            self._open_volume(i)
+            self.file_pos = volume_offset - self._vol_total[i - 1]
+            os.lseek(self._fd, self.file_pos, os.SEEK_SET)
 
-        self._open_volume(i)
-
-        self.file_pos = offset - self.volumes[i - 1]["total_size"]
         self.total_pos = offset
-
-        self.file.seek(self.file_pos)
-        self.buffer = b""
-        self.last_nl = 0
-        self.EOF = True if offset == self.volumes[-1]["total_size"] else False
+        self._reset_buffer()
+        self.EOF = offset >= total_size
 
         return offset
 
     def truncate(self, size=-1):
         # delete unneeded volumes, truncate last needed volume to size
-        if "wb" not in self.mode and "+" not in self.mode:
+        if not self._is_new and not self._is_plus:
             raise io.UnsupportedOperation("Cannot truncate in read mode")
 
         if self.closed:
@@ -257,37 +358,33 @@ class SplitFile(object):
             size = self.total_pos
 
         start_pos = self.tell()
-        if size > self.volumes[-1]["total_size"]:  # extend file
+        if size > self._vol_total[-1]:  # extend file
             self.seek(0, 2)
-            add_size = size - self.volumes[-1]["total_size"]
-            num_blocks = int(add_size / self.BLOCKSIZE)
-            if num_blocks > 0:
-                write_data = b"0" * self.BLOCKSIZE
-            for b in range(num_blocks):
-                self.write(write_data)
-
-            self.write(b"0" * (add_size - (num_blocks * self.BLOCKSIZE)))
+            self.last_io = "w"
+            self.first_io = False
+            self._extend(size - self._vol_total[-1])
             self.seek(start_pos)
 
         else:  # reduce size of file
             if self.total_pos != size:
                 self.seek(size)
-            self.file.truncate(self.file_pos)
-            self.volumes[self.file_index]["total_size"] = size
+            os.ftruncate(self._fd, self.file_pos)
+            self._volume_dirty = self.file_pos > 0
+            self._vol_total[self.file_index] = size
 
-            for v in range(len(self.volumes) - 1, self.file_index, -1):
-                suff = "." + str(v) if v > 1 else ""
-                if os.path.exists(self.file_name + suff):
-                    try:
-                        os.remove(self.file_name + suff)
-                    except IOError:
-                        raise IOError(
-                            "Unable to remove volume "
-                            + self.file_name
-                            + suff
-                            + " as part of truncate operation"
-                        )
-                del self.volumes[v]
+            for v in range(len(self._vol_total) - 1, self.file_index, -1):
+                try:
+                    os.remove(self._get_file_name(v))
+                except FileNotFoundError:  # unused volume already removed
+                    pass
+                except IOError:
+                    raise IOError(
+                        "Unable to remove volume "
+                        + self._get_file_name(v)
+                        + " as part of truncate operation"
+                    )
+                del self._vol_size[v]
+                del self._vol_total[v]
 
             self.seek(start_pos)
 
@@ -296,12 +393,13 @@ class SplitFile(object):
         if self.file_closed:
             return
 
-        if self.file:
-            self.file.close()
-            file_name = self._get_file_name()
-            if os.path.exists(file_name) and os.stat(file_name).st_size == 0:
+        if self._fd is not None:
+            empty = not self._volume_dirty and os.fstat(self._fd).st_size == 0
+            os.close(self._fd)
+            self._fd = None
+            if empty:
                 try:
-                    os.remove(file_name)
+                    os.remove(self._get_file_name())
                 except IOError:
                     pass
 
@@ -310,30 +408,29 @@ class SplitFile(object):
     def readable(self):
         if self.closed:
             raise ValueError("I/O operation on closed file.")
-        elif "rb" in self.mode or "+" in self.mode:
-            return True
         else:
-            return False
+            return self._can_read
 
     def writable(self):
         if self.closed:
             raise ValueError("I/O operation on closed file.")
-        elif self.mode in ["wb", "ab"] or "+" in self.mode:
-            return True
         else:
-            return False
+            return self._can_write
 
     def seekable(self):
         if self.closed:
             raise ValueError("I/O operation on closed file.")
-        else:
-            return self.file.seekable()
+
+        try:
+            os.lseek(self._fd, 0, os.SEEK_CUR)
+        except OSError:
+            return False
+        return True
 
     def flush(self):
+        # volumes are written unbuffered, so there is nothing to flush
         if self.closed:
             raise ValueError("I/O operation on closed file.")
-        else:
-            self.file.flush()
 
     @property
     def closed(self):
@@ -344,7 +441,7 @@ class SplitFile(object):
         if self.closed:
             raise ValueError("I/O operation on closed file.")
         else:
-            return self.volumes[-1]["total_size"]
+            return self._vol_total[-1]
 
     def __enter__(self):
         return self
@@ -352,6 +449,17 @@ class SplitFile(object):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    def __del__(self):
+        # release the volume descriptor of an object that was never closed,
+        # as io file objects do when garbage collected
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            self._fd = None
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
     def __iter__(self):
         return self
 
@@ -370,10 +478,40 @@ class SplitFile(object):
         """Return volume filename for a given index"""
         if index == -1:
             index = self.file_index
-        file_name = self.file_name
-        if index > 1:
-            file_name += "." + str(index)
-        return file_name
+        while len(self._names) < index:
+            self._names.append(f"{self.file_name}.{len(self._names) + 1}")
+        return self._names[max(index, 1) - 1]
+
+    def _scan_volumes(self):
+        """Return sizes of existing volumes in index order, found with a
+           single scan of the directory where possible
+        """
+        dir_name, base_name = os.path.split(self.file_name)
+        prefix = base_name + "."
+        found = {}
+        try:
+            with os.scandir(dir_name or ".") as entries:
+                for entry in entries:
+                    if entry.name == base_name:
+                        found[1] = entry
+                    elif entry.name.startswith(prefix):
+                        suff = entry.name[len(prefix) :]
+                        if suff.isdecimal() and str(int(suff)) == suff:
+                            found[int(suff)] = entry
+        except OSError:  # directory cannot be listed
+            found = {}
+
+        # volumes are only valid as an unbroken sequence from the first
+        sizes = []
+        if 1 not in found and os.path.exists(self.file_name):
+            # scan missed the first volume, e.g. the directory is not listable
+            # or names differ by case or unicode normalization, probe paths
+            while os.path.exists(self._get_file_name(len(sizes) + 1)):
+                sizes.append(os.stat(self._get_file_name(len(sizes) + 1)).st_size)
+        else:
+            while len(sizes) + 1 in found:
+                sizes.append(found[len(sizes) + 1].stat().st_size)
+        return sizes
 
     def _open_volume(self, new_file_index):
         """Close prior volume if open, and open new volume (if possible
@@ -387,45 +525,45 @@ class SplitFile(object):
 
         if (
             self.last_io == "w"
-            or ("wb" in self.mode and self.last_io != "r")
-            or ("ab" in self.mode and self.last_io != "r")
+            or (self._is_new and self.last_io != "r")
+            or (self._is_append and self.last_io != "r")
             or path_exists
         ):
             if self.mode == "rb+" and self.last_io == "w" and not path_exists:
                 mode = "wb+"  # new volume file
-            elif ("wb" in self.mode and path_exists) or (
-                "ab" in self.mode and path_exists
-            ):
+            elif (self._is_new or self._is_append) and path_exists:
                 mode = "rb+"  # open existing volume file
             else:
                 mode = self.mode
 
-            # remove unused volume file
-            if not self.first_io and self.file:
-                self.file.close()
-                old_file_name = self._get_file_name()
-                if (
-                    os.path.exists(old_file_name)
-                    and os.stat(old_file_name).st_size == 0
-                ):
+            # close prior volume, remove unused volume file
+            if self._fd is not None:
+                empty = (
+                    not self.first_io
+                    and not self._volume_dirty
+                    and os.fstat(self._fd).st_size == 0
+                )
+                os.close(self._fd)
+                self._fd = None
+                if empty:
                     try:
-                        os.remove(old_file_name)
+                        os.remove(self._get_file_name())
                     except IOError:
                         pass
 
             if self.last_io == "w":
                 self.file_pos = 0
-                self.total_pos = self.volumes[new_file_index - 1]["total_size"]
+                self.total_pos = self._vol_total[new_file_index - 1]
 
             # for new files, populate volume sizes data
-            if not path_exists and self.volume_size > 0:
-                vs = {
-                    "volume_size": self.volume_size,
-                    "total_size": self.volumes[new_file_index - 1]["total_size"],
-                }
-                self.volumes.insert(new_file_index, vs)
-
-            self.file = python_open(new_file_name, mode)
+            if not path_exists:
+                self._vol_size.insert(new_file_index, self.volume_size)
+                self._vol_total.insert(
+                    new_file_index, self._vol_total[new_file_index - 1]
+                )
+
+            self._fd = os.open(new_file_name, _OPEN_FLAGS[mode], 0o666)
+            self._volume_dirty = False
             self.file_index = new_file_index
             return True
         else:
@@ -433,98 +571,264 @@ class SplitFile(object):
 
     def _write(self, data):
         """write bytes data to file, advance to next volume if needed"""
-        if self.volume_size == 0:  # for volume_size =0, do not split to volumes
-            bytes_written = self.file.write(data)
-            self.file_pos += bytes_written
-            self.total_pos += bytes_written
-            self.volumes[self.file_index]["total_size"] = max(
-                self.total_pos, self.volumes[self.file_index]["total_size"]
-            )
-            return bytes_written
+        mv = memoryview(data).cast("B")
+        if not len(mv):  # empty writes do not change the file
+            return 0
 
         # is position is beyond current size of the file, truncate to extend
-        if self.total_pos > self.volumes[-1]["total_size"]:
+        if self.total_pos > self._vol_total[-1]:
             self.truncate()
 
+        if self.volume_size == 0:  # for volume_size =0, do not split to volumes
+            bytes_written = self._write_volume(mv)
+            self._advance_write(bytes_written)
+            return bytes_written
+
+        # advance an offset through the memoryview rather than slicing data
+        data_size = len(mv)
+        offset = 0
         bytes_written = 0
-        while len(data) > 0:
-            write_size = 0
-            while write_size == 0:
-                write_size = min(
-                    len(data),
-                    self.volumes[self.file_index]["volume_size"] - self.file_pos,
+        while offset < data_size:
+            write_size = min(
+                data_size - offset, self._vol_size[self.file_index] - self.file_pos
+            )
+            if write_size <= 0:
+                self._next_file()
+                continue
+
+            bytes_written += self._write_volume(mv[offset : offset + write_size])
+            offset += write_size
+            self._advance_write(write_size)
+
+        return bytes_written
+
+    def _write_volume(self, mv):
+        """write all of memoryview mv to the current volume"""
+        written = 0
+        while written < len(mv):
+            written += os.write(self._fd, mv[written:])
+        return written
+
+    def _extend(self, add_size):
+        """extend stream with add_size zero bytes from the end of the last
+           volume, resizing volume files rather than writing zeros
+        """
+        while add_size > 0:
+            extend_size = add_size
+            if self.volume_size > 0:
+                extend_size = min(
+                    add_size, self._vol_size[self.file_index] - self.file_pos
                 )
-                if write_size > 0:
-                    break
-                else:
+                if extend_size <= 0:
                     self._next_file()
+                    continue
 
-            output = data[:write_size]
-            self.file_pos += len(output)
-            self.total_pos += len(output)
-            bytes_written += self.file.write(output)
-            self.volumes[self.file_index]["total_size"] = max(
-                self.total_pos, self.volumes[self.file_index]["total_size"]
-            )
-            data = data[len(output) :]
+            try:
+                os.ftruncate(self._fd, self.file_pos + extend_size)
+            except OSError:  # resize not supported, fall back to writing zeros
+                while add_size > 0:
+                    add_size -= self._write(
+                        _ZERO_BLOCK[: min(add_size, len(_ZERO_BLOCK))]
+                    )
+                return
+
+            os.lseek(self._fd, self.file_pos + extend_size, os.SEEK_SET)
+            self._advance_write(extend_size)
+            add_size -= extend_size
+
+    def _advance_write(self, size):
+        """advance positions and volume size after writing to current volume"""
+        if size:
+            self._volume_dirty = True
+        self.file_pos += size
+        self.total_pos += size
+        if self.total_pos > self._vol_total[self.file_index]:
+            self._vol_total[self.file_index] = self.total_pos
+
+    def _start_read(self):
+        """check file is open for reading and prepare read buffer, returns
+           False if at end of file
+        """
+        if not self._can_read:
+            raise io.UnsupportedOperation("Cannot read in write mode")
 
-        return bytes_written
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if self.last_io == "w":  # reset read buffer after write operation
+            self._reset_buffer()
+
+        if self.first_io:  # first read from first volume
+            self.first_io = False
+            self._reset_buffer()
+
+        if self.EOF:
+            return False
+        self.last_io = "r"
+        return True
+
+    def _readinto(self, mv, single=False):
+        """read into memoryview mv, first from the buffer, then directly from
+           volumes while at least a block remains to be read.  If single, stop
+           after buffered data or one volume read.
+        """
+        size = len(mv)
+        n = min(len(self.buffer) - self.read_pos, size)
+        if n:
+            mv[:n] = memoryview(self.buffer)[self.read_pos : self.read_pos + n]
+            self._consume(n)
+
+        while n < size and not (single and n):
+            if size - n < self.block_size:  # fill buffer, copy from it
+                if not self._fill_buffer():
+                    self.EOF = True
+                    break
+                k = min(len(self.buffer) - self.read_pos, size - n)
+                mv[n : n + k] = memoryview(self.buffer)[
+                    self.read_pos : self.read_pos + k
+                ]
+                self._consume(k)
+            else:  # buffer is empty, read directly into mv
+                k = _fd_readinto(self._fd, mv[n:])
+                if not k:
+                    if self._next_file():
+                        continue
+                    self.EOF = True
+                    break
+            n += k
+
+        self._advance_read(n)
+        return n
 
     def _return_read(self, output):
+        """advance read position based on read, return output"""
+        self._advance_read(len(output))
+        return output
+
+    def _advance_read(self, size):
         """advance total and volume specific read position based on read"""
-        self.total_pos += len(output)
-        i = self.file_index
+        self.total_pos += size
 
-        while True:
-            if self.total_pos > self.volumes[i]["total_size"]:
-                i += 1
-            elif self.total_pos < self.volumes[i - 1]["total_size"]:
-                i -= 1
-            else:
-                break
+        # usually still within the current volume, otherwise locate it
+        i = self.file_index
+        if not self._vol_total[i - 1] <= self.total_pos <= self._vol_total[i]:
+            i = max(bisect.bisect_left(self._vol_total, self.total_pos), 1)
 
-        self.file_pos = self.total_pos - self.volumes[i - 1]["total_size"]
-        return output
+        self.file_pos = self.total_pos - self._vol_total[i - 1]
 
-    def _read_file(self, size=-1):
-        """read block from file, advance to next volume if needed"""
-        if size == -1:
-            size = self.BLOCKSIZE
+    def _fill_buffer(self):
+        """read next block from file onto the end of the buffer, advance to
+           next volume if needed.  Returns number of bytes added, 0 at end of
+           last volume.
+        """
         while True:
-            data = self.file.read(size)
-            if not data:
-                if self._next_file():
-                    continue
-                else:
-                    return b""
-            else:
-                return data
+            n = _fd_readinto(self._fd, self._read_mv)
+            if n:
+                self.buffer.extend(self._read_mv[:n])
+                return n
+            elif not self._next_file():
+                return 0
 
     def _read_buffer(self, size, line):
         """add new data to buffer, and read if enough data is available"""
+        available = len(self.buffer) - self.read_pos
         rp = -1
         if line:
-            rp = self.buffer.find(b"\n", self.last_nl)
+            # only scan data added since the last unsuccessful search
+            rp = self.buffer.find(b"\n", max(self.last_nl, self.read_pos))
             if rp == -1:
                 self.last_nl = len(self.buffer)
             else:
-                rp += 1
-                self.last_nl = 0
+                rp += 1 - self.read_pos
 
-            if size != -1 and len(self.buffer) >= size and size < rp:
+            # a size limited line is returned once size bytes are available,
+            # without buffering ahead to the end of the line
+            if size != -1 and available >= size and (rp == -1 or size < rp):
                 rp = size
         else:
-            if size != -1 and len(self.buffer) >= size:
+            if size != -1 and available >= size:
                 rp = size
 
         if rp == -1:
             return None
-        else:  # read from beginning of buffer to position RP
-            output = self.buffer[:rp]
-            self.buffer = self.buffer[rp:]
+        else:  # read from read position of buffer to position RP
+            output = bytes(memoryview(self.buffer)[self.read_pos : self.read_pos + rp])
+            self._consume(rp)
             return output
 
+    def _consume(self, size):
+        """advance read position of buffer past size bytes read from it"""
+        self.read_pos += size
+        self.last_nl = max(self.last_nl, self.read_pos)
+
+        # compact buffer once more than half of it has been consumed
+        if self.read_pos > len(self.buffer) // 2:
+            del self.buffer[: self.read_pos]
+            self.last_nl -= self.read_pos
+            self.read_pos = 0
+
+    def _reset_buffer(self):
+        """discard buffered read data"""
+        self.buffer = bytearray()
+        self.read_pos = 0
+        self.last_nl = 0
+
+
+# Shared block of zero bytes, for extending volumes that cannot be resized
+_ZERO_BLOCK = memoryview(bytes(SplitFile.BLOCKSIZE))
+
+# os.open flags for each volume file mode, matching builtins.open
+_O_BINARY = getattr(os, "O_BINARY", 0)  # Windows only
+_OPEN_FLAGS = {
+    "rb": os.O_RDONLY | _O_BINARY,
+    "rb+": os.O_RDWR | _O_BINARY,
+    "wb": os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+    "wb+": os.O_RDWR | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+    "ab": os.O_WRONLY | os.O_CREAT | os.O_APPEND | _O_BINARY,
+    "ab+": os.O_RDWR | os.O_CREAT | os.O_APPEND | _O_BINARY,
+}
+
+
+def _copy_range(src_fd, dst_fd, count, block_size):
+    """copy up to count bytes between the current positions of two file
+       descriptors, in the kernel where supported, otherwise through a user
+       space block of at most block_size.  Returns bytes copied.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            return os.copy_file_range(src_fd, dst_fd, count)
+        except OSError:  # e.g. unsupported filesystem or append mode
+            pass
+
+    # only Linux accepts a file as destination and an offset of None
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        try:
+            return os.sendfile(dst_fd, src_fd, None, count)
+        except OSError:
+            pass
+
+    data = memoryview(os.read(src_fd, min(count, block_size)))
+    written = 0
+    while written < len(data):
+        written += os.write(dst_fd, data[written:])
+    return written
+
+
+if hasattr(os, "readv"):
+
+    def _fd_readinto(fd, buffer):
+        """read from file descriptor directly into a writable buffer"""
+        return os.readv(fd, [buffer])
+
+else:  # Windows
+
+    def _fd_readinto(fd, buffer):
+        """read from file descriptor into a writable buffer"""
+        data = os.read(fd, len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
 
-def open(filename, mode, volume_size=0, append_to_partial=True):
+def open(filename, mode, volume_size=0, append_to_partial=True, block_size=None):
     """alternative constructor"""
-    return SplitFile(filename, mode, volume_size, append_to_partial)
+    return SplitFile(filename, mode, volume_size, append_to_partial, block_size)